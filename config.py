@@ -11,9 +11,7 @@ SOURCE_DIR = DATA_DIR / "source_documents"
 PROCESSED_DIR = DATA_DIR / "processed"
 LOG_DIR = DATA_DIR / "logs"
 
-# Ensure directories exist
-for dir_path in [SOURCE_DIR, PROCESSED_DIR, LOG_DIR]:
-    dir_path.mkdir(parents=True, exist_ok=True)
+# Directories are created at startup by src.utils.ensure_directories()
 
 # API Settings
 ANTHROPIC_MODEL = "claude-3-opus-20240229"  # or "claude-3-sonnet-20240229" for faster/cheaper option
@@ -25,3 +23,4 @@ BATCH_DELAY = 5          # Seconds to pause between batches
 MAX_RETRIES = 3          # Maximum number of retries for failed documents
 API_MAX_RETRIES = 3      # Maximum retries for API calls
 COPY_MAX_RETRIES = 3     # Maximum retries for file operations
+CHECKPOINT_FSYNC_INTERVAL = 32  # Checkpoint entries written between fsync calls
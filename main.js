@@ -1010,9 +1010,20 @@ ipcMain.handle('get-directory-contents', async (event, dirPath) => {
 ipcMain.handle('resetCheckpoint', async () => {
   try {
     const { dataDir } = getDataDirectories();
-    const checkpointPath = path.join(dataDir, 'checkpoint.json');
-    if (fs.existsSync(checkpointPath)) {
-      fs.writeFileSync(checkpointPath, '[]');
+    // checkpoint.jsonl is the current format; checkpoint.json is still written
+    // by older Python scripts kept in the app data directory
+    const checkpointFiles = [
+      { path: path.join(dataDir, 'checkpoint.jsonl'), empty: '' },
+      { path: path.join(dataDir, 'checkpoint.json'), empty: '[]' }
+    ];
+    let found = false;
+    for (const checkpoint of checkpointFiles) {
+      if (fs.existsSync(checkpoint.path)) {
+        fs.writeFileSync(checkpoint.path, checkpoint.empty);
+        found = true;
+      }
+    }
+    if (found) {
       console.log('Checkpoint reset successfully');
       return { success: true };
     }
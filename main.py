@@ -11,6 +11,7 @@ import platform
 import shutil
 import subprocess
 import io
+import signal
 
 # Add the project root to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -37,7 +38,7 @@ else:
     print("Poppler path environment variable not set. Will check during document processing.")
 
 # Import project modules
-from src.utils import setup_logging, save_checkpoint, load_checkpoint, save_failed_list
+from src.utils import ensure_directories, setup_logging, append_checkpoint, close_checkpoint, load_checkpoint, save_failed_list
 from src.file_handler import get_source_documents, organize_document
 from src.ai_processor import process_document, check_poppler_installation
 import config
@@ -45,6 +46,9 @@ import config
 def main():
     """Main entry point for the tax document processor"""
 
+    # Make sure the data directories exist
+    ensure_directories()
+
     # Set up logging
     logger = setup_logging()
     logger.info("Starting tax document processor")
@@ -109,7 +113,6 @@ def main():
     # Initialize results tracking
     results = {'success': 0, 'failed': 0, 'retry_success': 0}
     failed_docs = []
-    newly_processed = []
 
     print(f"Processing {len(pdf_files)} documents in batches of {config.BATCH_SIZE}...")
 
@@ -149,10 +152,6 @@ def main():
                                     results['success'] += 1
                                 success = True
 
-                                # Add to processed list for checkpoint
-                                newly_processed.append(str(pdf_path))
-                                processed_paths.add(str(pdf_path))
-
                                 # Display success info
                                 client_name = client_folder_name or document_data.get('client_name', 'Unknown')
                                 print(f"{SYMBOLS['success']} Successfully processed: {pdf_path.name}")
@@ -176,13 +175,18 @@ def main():
                                 results['failed'] += 1
                                 failed_docs.append(str(pdf_path))
 
+                    # Record in the checkpoint as soon as it is processed. The document is
+                    # already organized, so a checkpoint error must not trigger a retry.
+                    if success:
+                        processed_paths.add(str(pdf_path))
+                        try:
+                            append_checkpoint(str(pdf_path))
+                        except Exception as e:
+                            logger.warning(f"Could not update checkpoint for {pdf_path}: {str(e)}")
+
                     # Update progress bar
                     pbar.update(1)
 
-                    # Save checkpoint every 5 documents
-                    if len(newly_processed) % 5 == 0 and newly_processed:
-                        save_checkpoint(list(processed_paths))
-
                     # Add small random delay between documents (100-300ms)
                     time.sleep(random.uniform(0.1, 0.3))
 
@@ -193,16 +197,13 @@ def main():
                     failed_docs.append(str(pdf_path))
                     pbar.update(1)
 
-        # Save checkpoint after each batch
-        save_checkpoint(list(processed_paths))
-
         # Delay between batches to prevent API rate limiting
         if batch_end < len(pdf_files):
             print(f"Waiting {config.BATCH_DELAY}s before next batch...")
             time.sleep(config.BATCH_DELAY)
 
-    # Final checkpoint
-    save_checkpoint(list(processed_paths))
+    # Make sure the final checkpoint entries are on disk
+    close_checkpoint()
 
     # Save failed document list
     failed_path = None
@@ -224,7 +225,14 @@ def main():
 
     logger.info(f"Processing complete. Success: {results['success']}, Retry Success: {results['retry_success']}, Failed: {results['failed']}")
 
+def handle_sigterm(signum, frame):
+    """Exit on SIGTERM so atexit handlers can drain the log queue and flush files"""
+    sys.exit(128 + signum)
+
 if __name__ == "__main__":
+    # The Electron app stops processing with SIGTERM
+    signal.signal(signal.SIGTERM, handle_sigterm)
+
     try:
         main()
     except Exception as e:
@@ -18,6 +18,16 @@ from src.direct_pdf_converter import convert_pdf_to_image, create_text_image
 
 logger = logging.getLogger(__name__)
 
+# Response labels from the analysis prompt mapped to their document_data field
+RESPONSE_FIELDS = {
+    'document type': 'document_type',
+    'client name': 'client_name',
+    'period/year': 'period_year',
+    'institution': 'institution',
+    'account number': 'account_number',
+    'total value': 'total_value'
+}
+
 def find_poppler_mac():
     """Find Poppler installation on macOS"""
     # Direct binary check first - most reliable
@@ -384,28 +394,37 @@ def parse_ai_response(text):
         if not line:
             continue
 
+        # Fast path: exact label match for lines in the requested format
+        label, sep, value = line.partition(":")
+        field = RESPONSE_FIELDS.get(label.strip().lower()) if sep else None
+        if field:
+            data[field] = value.strip()
+            continue
+
+        line_lower = line.lower()
+
         # Extract document type
-        if "document type:" in line.lower():
+        if "document type:" in line_lower:
             data['document_type'] = line.split(":", 1)[1].strip()
 
         # Extract client name
-        elif "client name:" in line.lower() or "recipient" in line.lower():
+        elif "client name:" in line_lower or "recipient" in line_lower:
             data['client_name'] = line.split(":", 1)[1].strip()
 
         # Extract period/year
-        elif "period" in line.lower() or "year" in line.lower():
+        elif "period" in line_lower or "year" in line_lower:
             data['period_year'] = line.split(":", 1)[1].strip()
 
         # Extract institution
-        elif "institution" in line.lower() or "payer" in line.lower():
+        elif "institution" in line_lower or "payer" in line_lower:
             data['institution'] = line.split(":", 1)[1].strip()
 
         # Extract account number
-        elif "account number" in line.lower():
+        elif "account number" in line_lower:
             data['account_number'] = line.split(":", 1)[1].strip()
 
         # Extract total value
-        elif "total value" in line.lower() or "balance" in line.lower():
+        elif "total value" in line_lower or "balance" in line_lower:
             data['total_value'] = line.split(":", 1)[1].strip()
 
     return data
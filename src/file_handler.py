@@ -57,7 +57,6 @@ def organize_document(pdf_path, document_data, client_folder_name=None):
         # Extract key fields with fallbacks for missing data
         doc_type = document_data.get('document_type', 'unknown')
         period = document_data.get('period_year', 'unknown')
-        institution = document_data.get('institution', 'unknown')
 
         # Use client_folder_name if provided, otherwise fall back to extracted name
         if client_folder_name and client_folder_name.strip():
@@ -70,19 +69,16 @@ def organize_document(pdf_path, document_data, client_folder_name=None):
 
         # Clean up names for filesystem use
         doc_type_clean = clean_filename(doc_type)
-        institution_clean = clean_filename(institution)
 
         # Create directory structure with absolute paths to ensure consistency
         client_dir = config.PROCESSED_DIR / client_clean
         client_dir.mkdir(parents=True, exist_ok=True)
         logger.info(f"Created client directory: {client_dir}")
 
-        # Create new filename
-        new_filename = f"{doc_type_clean}_{period}.pdf"
-        dest_path = client_dir / new_filename
-        
-        # Also create a JSON metadata file
-        json_path = client_dir / f"{doc_type_clean}_{period}.json"
+        # Create new filename, sharing the base name with the JSON metadata file
+        base_name = f"{doc_type_clean}_{period}"
+        dest_path = client_dir / f"{base_name}.pdf"
+        json_path = client_dir / f"{base_name}.json"
         
         # IMPORTANT: Use only ASCII characters in log messages
         # Do NOT use Unicode arrow character here - this is what was causing the bug
@@ -2,7 +2,11 @@ import os
 import json
 import time
 import logging
+import logging.handlers
+import atexit
+import queue
 import re
+import functools
 import sys
 import io
 import platform
@@ -10,10 +14,58 @@ from datetime import datetime
 from pathlib import Path
 import config
 
+try:
+    # orjson is a much faster drop-in for json when it is installed
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    HAVE_ORJSON = False
+
+# Single-pass pattern for clean_filename: each whitespace run and each
+# special character becomes one underscore
+_RE_UNSAFE = re.compile(r'\s+|[^\w\s-]')
+
+class BufferedFileHandler(logging.FileHandler):
+    """FileHandler that writes through a large buffer instead of flushing every record"""
+
+    def __init__(self, filename, mode='a', encoding=None, buffer_size=65536, flush_level=logging.ERROR):
+        # Set before the base class opens the stream
+        self.buffer_size = buffer_size
+        self.flush_level = flush_level
+        super().__init__(filename, mode, encoding)
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding, errors=self.errors)
+
+    def emit(self, record):
+        """Write the record, flushing only for records at or above flush_level"""
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= self.flush_level:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+class FlushingQueueListener(logging.handlers.QueueListener):
+    """QueueListener that flushes its handlers whenever the queue runs empty"""
+
+    def dequeue(self, block):
+        # Bursts of records stay buffered, but nothing is left unwritten while idle
+        if block and self.queue.empty():
+            for handler in self.handlers:
+                handler.flush()
+        return self.queue.get(block)
+
 def setup_logging():
     """Set up logging configuration"""
     # Create logs directory if it doesn't exist
-    config.LOG_DIR.mkdir(parents=True, exist_ok=True)
+    if not config.LOG_DIR.is_dir():
+        config.LOG_DIR.mkdir(parents=True, exist_ok=True)
     
     # Create log file with timestamp
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -22,9 +74,16 @@ def setup_logging():
     # On Windows, use basic ASCII logging only - most reliable solution
     is_windows = platform.system() == "Windows"
     
+    log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    
     # Configure logging with UTF-8 encoding for file handler
     # On Windows, use a more basic configuration that avoids Unicode characters
-    handlers = [logging.FileHandler(log_file, encoding='utf-8')]
+    # File records are written through a large buffer; errors flush immediately
+    # and the listener flushes whenever it has drained the queue
+    file_handler = BufferedFileHandler(log_file, encoding='utf-8')
+    atexit.register(file_handler.close)
+    atexit.register(file_handler.flush)
+    handlers = [file_handler]
     
     # Add StreamHandler with appropriate encoding
     if is_windows:
@@ -34,13 +93,22 @@ def setup_logging():
         # On non-Windows, we can use UTF-8 
         handlers.append(logging.StreamHandler())
     
+    # Hand records to a background thread so disk writes stay off the processing path.
+    # Records are formatted once by the queue handler; the listener's handlers
+    # write the prepared message as-is.
+    log_queue = queue.Queue(-1)
+    listener = FlushingQueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    
     logging.basicConfig(
         level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=handlers
+        format=log_format,
+        handlers=[logging.handlers.QueueHandler(log_queue)]
     )
     
     logger = logging.getLogger(__name__)
+    logger._listener = listener
     
     # Log platform info for debugging
     logger.info(f"Platform: {platform.system()} {platform.release()}")
@@ -51,23 +119,129 @@ def setup_logging():
     
     return logger
 
+def _dump_json(data):
+    """Serialize data to JSON bytes, using orjson when available"""
+    if HAVE_ORJSON:
+        try:
+            return orjson.dumps(data)
+        except TypeError:
+            # orjson rejects lone surrogates, which Path.glob produces for
+            # filenames that are not valid UTF-8; escape them instead
+            return json.dumps(data).encode('ascii')
+    try:
+        return json.dumps(data, ensure_ascii=False).encode('utf-8')
+    except UnicodeEncodeError:
+        # Lone surrogates cannot be encoded as UTF-8; escape them instead
+        return json.dumps(data).encode('ascii')
+
+def _load_json(raw):
+    """Deserialize JSON bytes, using orjson when available"""
+    if HAVE_ORJSON:
+        try:
+            return orjson.loads(raw)
+        except ValueError:
+            # Escaped lone surrogates are valid for json but rejected by orjson
+            pass
+    return json.loads(raw)
+
+# Checkpoint is stored as JSON Lines (one processed path per line) so that
+# each update only appends new entries instead of rewriting the whole list
+_checkpoint_fh = None
+_checkpoint_seen = set()
+_checkpoint_unsynced = 0
+
+def _checkpoint_file():
+    """Return the checkpoint append handle, opening it on first use"""
+    global _checkpoint_fh
+    
+    if _checkpoint_fh is None:
+        _checkpoint_fh = open(config.DATA_DIR / "checkpoint.jsonl", 'a+b')
+        # Terminate a partial line left behind by an interrupted write
+        if _checkpoint_fh.tell() > 0:
+            _checkpoint_fh.seek(-1, os.SEEK_END)
+            if _checkpoint_fh.read(1) != b"\n":
+                _checkpoint_fh.write(b"\n")
+    
+    return _checkpoint_fh
+
+def append_checkpoint(path):
+    """Append a single processed file to the checkpoint"""
+    save_checkpoint([path])
+
 def save_checkpoint(processed_paths):
     """Save checkpoint of processed files"""
-    checkpoint_path = config.DATA_DIR / "checkpoint.json"
+    global _checkpoint_unsynced
     
-    with open(checkpoint_path, 'w', encoding='utf-8') as f:
-        json.dump(processed_paths, f, ensure_ascii=True)
+    new_paths = [path for path in dict.fromkeys(processed_paths) if path not in _checkpoint_seen]
+    if not new_paths:
+        return
+    
+    # Serialize all new entries up front and write them in a single call
+    checkpoint_fh = _checkpoint_file()
+    checkpoint_fh.write(b"".join(_dump_json(path) + b"\n" for path in new_paths))
+    checkpoint_fh.flush()
+    _checkpoint_seen.update(new_paths)
+    
+    # fsync is expensive, so only force entries to disk every few updates
+    _checkpoint_unsynced += len(new_paths)
+    if _checkpoint_unsynced >= config.CHECKPOINT_FSYNC_INTERVAL:
+        os.fsync(checkpoint_fh.fileno())
+        _checkpoint_unsynced = 0
 
-def load_checkpoint():
-    """Load checkpoint of processed files"""
-    checkpoint_path = config.DATA_DIR / "checkpoint.json"
+def close_checkpoint():
+    """Force any unsynced checkpoint entries to disk and close the checkpoint file"""
+    global _checkpoint_fh, _checkpoint_unsynced
+    
+    if _checkpoint_fh is None:
+        return
     
-    if not checkpoint_path.exists():
+    _checkpoint_fh.flush()
+    os.fsync(_checkpoint_fh.fileno())
+    _checkpoint_fh.close()
+    _checkpoint_fh = None
+    _checkpoint_unsynced = 0
+
+# Also covers runs stopped early, e.g. by SIGTERM from the Electron app
+atexit.register(close_checkpoint)
+
+def _migrate_legacy_checkpoint():
+    """Convert a checkpoint.json list written by older versions to checkpoint.jsonl"""
+    legacy_path = config.DATA_DIR / "checkpoint.json"
+    
+    try:
+        with open(legacy_path, 'rb') as f:
+            processed_paths = _load_json(f.read())
+    except FileNotFoundError:
         return []
+    except Exception as e:
+        print(f"Error loading legacy checkpoint: {e}")
+        return []
+    
+    # Make sure the converted entries are on disk before dropping the old file
+    save_checkpoint(processed_paths)
+    if _checkpoint_fh is not None:
+        os.fsync(_checkpoint_fh.fileno())
+    legacy_path.unlink()
+    
+    return processed_paths
+
+def load_checkpoint():
+    """Load checkpoint of processed files"""
+    checkpoint_path = config.DATA_DIR / "checkpoint.jsonl"
     
     try:
-        with open(checkpoint_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(checkpoint_path, 'rb') as f:
+            processed_paths = []
+            for line in f:
+                try:
+                    processed_paths.append(_load_json(line))
+                except ValueError:
+                    # Skip blank lines and lines torn by an interrupted write
+                    continue
+        _checkpoint_seen.update(processed_paths)
+        return processed_paths
+    except FileNotFoundError:
+        return _migrate_legacy_checkpoint()
     except Exception as e:
         print(f"Error loading checkpoint: {e}")
         return []
@@ -80,20 +254,19 @@ def save_failed_list(failed_paths):
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     failed_path = config.LOG_DIR / f"failed_{timestamp}.json"
     
-    with open(failed_path, 'w', encoding='utf-8') as f:
-        json.dump(failed_paths, f, ensure_ascii=True)
+    with open(failed_path, 'wb') as f:
+        f.write(_dump_json(failed_paths))
     
     return str(failed_path)
 
+@functools.lru_cache(maxsize=4096)
 def clean_filename(name):
     """Clean a string to be suitable for a filename"""
     if not name:
         return "unknown"
         
-    # Replace special characters with underscores
-    cleaned = re.sub(r'[^\w\s-]', '_', name)
-    # Replace whitespace with underscores
-    cleaned = re.sub(r'[\s]+', '_', cleaned)
+    # Replace special characters and whitespace with underscores
+    cleaned = _RE_UNSAFE.sub('_', name)
     # Truncate if too long
     if len(cleaned) > 100:
         cleaned = cleaned[:100]
@@ -107,8 +280,6 @@ def ensure_directories():
     """Ensure all required directories exist"""
     # Create base directories
     for dir_path in [config.SOURCE_DIR, config.PROCESSED_DIR, config.LOG_DIR]:
-        dir_path.mkdir(parents=True, exist_ok=True)
-        print(f"Ensured directory exists: {dir_path}")
-
-# Ensure directories exist when module is imported
-ensure_directories()
+        # Skip the mkdir call entirely in the common case where it already exists
+        if not dir_path.is_dir():
+            dir_path.mkdir(parents=True, exist_ok=True)